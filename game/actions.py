@@ -1,14 +1,12 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, ClassVar, Self, cast
+from typing import TYPE_CHECKING, ClassVar, Final, Self, cast
 from contextlib import contextmanager
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 
 from .coords import HexCoord
 from .game_types import (
-    BUILDING_COSTS,
     FACTION_HOME_TERRAIN,
     POWER_ACTION_COSTS,
-    TERRAIN_CYCLE,
     ActionExecutor,
     BuildAction,
     BuildingType,
@@ -20,8 +18,6 @@ from .game_types import (
     ResourceCost,
     TerrainType,
     TransformAction,
-    is_gain_spades_action,
-    is_gain_workers_action,
 )
 
 if TYPE_CHECKING:
@@ -51,6 +47,8 @@ class ActionBuilder:
         finally:
             ActionBuilder.__is_constructing = False
 
+    __slots__ = ("__game", "__player")
+
     __game: Game
     __player: Name
 
@@ -71,63 +69,103 @@ class ActionBuilder:
             r: The r coordinate of the position.
             to_terrain: The type of terrain to transform to (e.g. "plains", "forest", "mountains")
         """
+        self.__game.execute_action(self._transform_action(q, r, to_terrain))
+
+    def build(self, q: int, r: int, building: str = "dwelling") -> None:
+        """Build a building at the specified position.
+        Args:
+            q: The q coordinate of the position.
+            r: The r coordinate of the position.
+            building: The type of building to build (e.g. "dwelling")
+        """
+        self.__game.execute_action(self._build_action(q, r, building))
+
+    def use_power(self, power_action: str) -> None:
+        """Use a power action.
+        Args:
+            power_action: The type of power action to use (e.g. "gain_spades", "gain_workers")
+        """
+        self.__game.execute_action(self._power_action(power_action))
+
+    def pass_turn(self) -> None:
+        """Pass for the remainder of the round."""
+        self.__game.execute_action(self._pass_action())
+
+    # Predicates: same checks as the actions above, but return False instead of raising
+
+    def can_transform(self, q: int, r: int, to_terrain: str) -> bool:
+        """Check whether transform() would succeed with these arguments."""
+        try:
+            action = self._transform_action(q, r, to_terrain)
+        except ValueError:
+            return False
+        return self.__game.can_execute(action)
+
+    def can_build(self, q: int, r: int, building: str = "dwelling") -> bool:
+        """Check whether build() would succeed with these arguments."""
+        try:
+            action = self._build_action(q, r, building)
+        except ValueError:
+            return False
+        return self.__game.can_execute(action)
+
+    def can_use_power(self, power_action: str) -> bool:
+        """Check whether use_power() would succeed with this power action."""
+        try:
+            action = self._power_action(power_action)
+        except ValueError:
+            return False
+        return self.__game.can_execute(action)
+
+    def can_pass(self) -> bool:
+        """Check whether pass_turn() would succeed."""
+        return self.__game.can_execute(self._pass_action())
+
+    # Action construction from string inputs
+
+    def _transform_action(self, q: int, r: int, to_terrain: str) -> TransformAction:
         try:
             terrain_type = TerrainType(to_terrain)
         except ValueError:
             raise ValueError(f"Invalid terrain type: {to_terrain}") from None
 
-        action: TransformAction = {
+        return {
             "action": "transform",
             "player": self.__player,
             "position": HexCoord(q, r),
             "target_terrain": terrain_type,
         }
-        self.__game.execute_action(action)
 
-    def build(self, q: int, r: int, building: str = "dwelling") -> None:
-        """Build a building at the specified position.
-        Args:
-            q: The q coordinate of the position.
-            r: The r coordinate of the position.
-            building: The type of building to build (e.g. "dwelling")
-        """
+    def _build_action(self, q: int, r: int, building: str) -> BuildAction:
         try:
             building_type = BuildingType(building)
         except ValueError:
             raise ValueError(f"Invalid building type: {building}") from None
 
-        action: BuildAction = {
+        return {
             "action": "build",
             "player": self.__player,
             "position": HexCoord(q, r),
             "building_type": building_type,
         }
-        self.__game.execute_action(action)
 
-    def use_power(self, power_action: str) -> None:
-        """Use a power action.
-        Args:
-            power_action: The type of power action to use (e.g. "gain_spades", "gain_workers")
-        """
+    def _power_action(self, power_action: str) -> PowerAction:
         try:
             power_type = PowerActionType(power_action)
         except ValueError:
             raise ValueError(f"Invalid power action: {power_action}") from None
 
-        action: PowerAction = {
+        return {
             "action": "power",
             "player": self.__player,
             "power_action": power_type,
         }
-        self.__game.execute_action(action)
 
-    def pass_turn(self) -> None:
-        """Pass for the remainder of the round."""
-        action: PassAction = {
+    def _pass_action(self) -> PassAction:
+        return {
             "action": "pass",
             "player": self.__player,
         }
-        self.__game.execute_action(action)
 
 
 class BaseActionExecutor(ActionExecutor):
@@ -136,6 +174,8 @@ class BaseActionExecutor(ActionExecutor):
     PATTERN: Template Method pattern for action execution
     """
 
+    __slots__ = ("__board", "__player")
+
     __board: Board
     __player: Player
 
@@ -164,34 +204,45 @@ class BaseActionExecutor(ActionExecutor):
         self.player.spend_resources(cost)
         self._perform(action)
 
+    def can_execute(self, action: GameAction) -> bool:
+        """Check if the action is legal and affordable, without raising."""
+        if self._validation_error(action) is not None:
+            return False
+        return self.player.can_afford(self.get_cost(action))
+
     def _validate(self, action: GameAction) -> None:
-        """Validate common action requirements."""
+        """Raise ValueError if the action is not legal."""
+        error = self._validation_error(action)
+        if error is not None:
+            raise ValueError(error)
+
+    def _validation_error(self, action: GameAction) -> str | None:
+        """Validate common action requirements. Returns why the action is illegal, or None."""
         if action["player"] != self.player.name:
-            raise ValueError(f"Action player mismatch: {action['player']}")
+            return f"Action player mismatch: {action['player']}"
         if self.player.has_passed:
-            raise ValueError("Player has already passed")
+            return "Player has already passed"
+        return None
 
     def _perform(self, action: GameAction) -> None:
         raise NotImplementedError
 
 
 class TransformExecutor(BaseActionExecutor):
+    __slots__ = ()
+
     def get_cost(self, action: GameAction) -> ResourceCost:
         """Calculate spades needed for transformation."""
         action = cast(TransformAction, action)
         target = action["target_terrain"]
         coord = action["position"]
         current = self.board.get_terrain(coord)
-        base_spades = self._calculate_distance(current, target)
-
-        # Apply faction ability
-        ability = self.player.faction_ability
-        spades = ability.modify_terrain_cost(base_spades)
 
-        return {"spades": spades}
+        return {"spades": self.player.transform_cost(current, target)}
 
-    def _validate(self, action: GameAction) -> None:
-        super()._validate(action)
+    def _validation_error(self, action: GameAction) -> str | None:
+        if (error := super()._validation_error(action)) is not None:
+            return error
         action = cast(TransformAction, action)
 
         target = action["target_terrain"]
@@ -199,89 +250,71 @@ class TransformExecutor(BaseActionExecutor):
 
         # Check position exists
         if not self.board.has_position(coord):
-            raise ValueError(f"Invalid position: {action['position']}")
+            return f"Invalid position: {action['position']}"
 
         # Check not already target terrain
         current = self.board.get_terrain(coord)
-        if current == target:
-            raise ValueError(f"Already {target.value} terrain")
+        if current is target:
+            return f"Already {target.value} terrain"
 
         # Check no building present
         if self.board.get_building(coord) is not None:
-            raise ValueError("Cannot transform terrain that has a building")
+            return "Cannot transform terrain that has a building"
 
         # Check adjacency to player's buildings
         if not self._is_adjacent_to_player_building(coord):
-            raise ValueError("Must be adjacent to your buildings")
+            return "Must be adjacent to your buildings"
+        return None
 
     def _perform(self, action: GameAction) -> None:
         action = cast(TransformAction, action)
         coord = action["position"]
         self.board.set_terrain(coord, action["target_terrain"])
 
-    def _calculate_distance(
-        self, from_terrain: TerrainType, to_terrain: TerrainType
-    ) -> int:
-        """Calculate spades needed between terrain types."""
-        if from_terrain == to_terrain:
-            return 0
-
-        cycle = TERRAIN_CYCLE
-        from_idx = cycle.index(from_terrain)
-        to_idx = cycle.index(to_terrain)
-        forward = (to_idx - from_idx) % len(cycle)
-        backward = (from_idx - to_idx) % len(cycle)
-
-        return min(forward, backward)
-
     def _is_adjacent_to_player_building(self, coord: HexCoord) -> bool:
         """Check if position is adjacent to player's buildings."""
-        for neighbor_coord in self.board.get_valid_neighbors(coord):
-            building = self.board.get_building(neighbor_coord)
-            if building and building["owner"] == self.player.name:
-                return True
-        return False
+        owned = self.board.get_player_buildings(self.player.name)
+        return not owned.isdisjoint(self.board.get_valid_neighbors(coord))
 
 
 class BuildExecutor(BaseActionExecutor):
+    __slots__ = ()
+
     def get_cost(self, action: GameAction) -> ResourceCost:
         """Get building cost with faction modifications."""
         action = cast(BuildAction, action)
-        building_type = action["building_type"]
-        base_cost = BUILDING_COSTS[building_type].copy()
+        return self.player.building_cost(action["building_type"])
 
-        # Apply faction ability
-        ability = self.player.faction_ability
-        return ability.modify_building_cost(base_cost)
-
-    def _validate(self, action: GameAction) -> None:
+    def _validation_error(self, action: GameAction) -> str | None:
         """STAGING:Validate building placement. Validates terrain, ownership, and placement rules."""
-        super()._validate(action)
+        if (error := super()._validation_error(action)) is not None:
+            return error
         action = cast(BuildAction, action)
         building_type = action["building_type"]
         coord = action["position"]
 
         # Check position exists
         if not self.board.has_position(coord):
-            raise ValueError(f"Invalid position: {action['position']}")
+            return f"Invalid position: {action['position']}"
 
         # Check correct terrain
         terrain = self.board.get_terrain(coord)
         home_terrain = FACTION_HOME_TERRAIN[self.player.faction]
-        if terrain != home_terrain:
-            raise ValueError(f"Can only build on {home_terrain.value}")
+        if terrain is not home_terrain:
+            return f"Can only build on {home_terrain.value}"
 
         # Check no existing building
         if self.board.get_building(coord) is not None:
-            raise ValueError("Position already has building")
+            return "Position already has building"
 
         # Only dwellings can be built directly
-        if building_type != BuildingType.DWELLING:
-            raise ValueError("Can only build dwellings directly")
+        if building_type is not BuildingType.DWELLING:
+            return "Can only build dwellings directly"
 
         # Check adjacency (except first building)
         if not self._is_adjacent_or_first_building(coord):
-            raise ValueError("Dwelling must be adjacent to your buildings")
+            return "Dwelling must be adjacent to your buildings"
+        return None
 
     def _perform(self, action: GameAction) -> None:
         action = cast(BuildAction, action)
@@ -290,7 +323,7 @@ class BuildExecutor(BaseActionExecutor):
 
         # Place building
         self.board.set_building(coord, building_type, self.player.name)
-        self.player.add_building(coord)
+        self.player.add_building(coord, building_type)
 
         # Award VP for building
         self.player.gain_victory_points(2)
@@ -300,16 +333,9 @@ class BuildExecutor(BaseActionExecutor):
 
     def _is_adjacent_or_first_building(self, coord: HexCoord) -> bool:
         """Check if this is first building or adjacent to player's buildings."""
-        # First building is always allowed
-        if not self.player.buildings_on_board:
-            return True
-
-        # Otherwise must be adjacent
-        for neighbor_coord in self.board.get_valid_neighbors(coord):
-            building = self.board.get_building(neighbor_coord)
-            if building and building["owner"] == self.player.name:
-                return True
-        return False
+        owned = self.board.get_player_buildings(self.player.name)
+        # First building is always allowed, otherwise must be adjacent
+        return not owned or not owned.isdisjoint(self.board.get_valid_neighbors(coord))
 
     def _notify_neighbors(self, coord: HexCoord, building_type: BuildingType) -> None:
         """Notify neighbors about new building for power gain."""
@@ -317,7 +343,16 @@ class BuildExecutor(BaseActionExecutor):
         self.board.notify_building_placed(coord, building_type, self.player.name)
 
 
+_POWER_ACTION_EFFECTS: Final[dict[PowerActionType, Callable[[Player], None]]] = {
+    PowerActionType.GAIN_SPADES: lambda player: player.gain_spades(2),
+    PowerActionType.GAIN_WORKERS: lambda player: player.gain_resource("workers", 2),
+}
+"""Effect of each power action, looked up directly instead of testing each type in turn."""
+
+
 class PowerActionExecutor(BaseActionExecutor):
+    __slots__ = ()
+
     def get_cost(self, action: GameAction) -> ResourceCost:
         """Get power cost for action."""
         action = cast(PowerAction, action)
@@ -327,13 +362,12 @@ class PowerActionExecutor(BaseActionExecutor):
     def _perform(self, action: GameAction) -> None:
         """Execute power action effects."""
         action = cast(PowerAction, action)
-        if is_gain_spades_action(action):
-            self.player.gain_spades(2)
-        elif is_gain_workers_action(action):
-            self.player.gain_resource("workers", 2)
+        _POWER_ACTION_EFFECTS[action["power_action"]](self.player)
 
 
 class PassExecutor(BaseActionExecutor):
+    __slots__ = ()
+
     def get_cost(self, action: GameAction) -> ResourceCost:
         """Passing is free."""
         return {}
@@ -343,6 +377,15 @@ class PassExecutor(BaseActionExecutor):
         self.player.mark_passed()
 
 
+_EXECUTOR_CLASSES: Final[dict[str, type[BaseActionExecutor]]] = {
+    "transform": TransformExecutor,
+    "build": BuildExecutor,
+    "power": PowerActionExecutor,
+    "pass": PassExecutor,
+}
+"""Executor class for each action kind, looked up by ActionFactory."""
+
+
 class ActionFactory:
     """
     PATTERN: Factory pattern for creating action executors
@@ -353,12 +396,8 @@ class ActionFactory:
     def create_executor(
         action: GameAction, board: Board, player: Player
     ) -> ActionExecutor:
-        match action["action"]:
-            case "transform":
-                return TransformExecutor(board, player)
-            case "build":
-                return BuildExecutor(board, player)
-            case "power":
-                return PowerActionExecutor(board, player)
-            case "pass":
-                return PassExecutor(board, player)
+        try:
+            executor_class = _EXECUTOR_CLASSES[action["action"]]
+        except KeyError:
+            raise ValueError(f"Unknown action: {action['action']}") from None
+        return executor_class(board, player)
@@ -1,4 +1,6 @@
 from __future__ import annotations
+from collections import deque
+from collections.abc import Set as AbstractSet
 from typing import Self
 
 
@@ -9,7 +11,6 @@ from .game_types import (
     BuildingType,
     Name,
     PowerObserver,
-    TerrainData,
     TerrainType,
 )
 
@@ -21,13 +22,46 @@ class Board:
     TYPE: Composition over inheritance - Board has a HexGrid
     """
 
-    __grid: HexGrid[TerrainData]
-    __observers: list[PowerObserver]
+    __slots__ = (
+        "__grid",
+        "__buildings",
+        "__observers",
+        "__positions_by_terrain",
+        "__buildings_by_owner",
+        "__empty_positions",
+        "__neighbors",
+        "__board_order",
+        "__area_parent",
+        "__area_size",
+        "__largest_area",
+        "__building_version",
+    )
+
+    __grid: HexGrid[TerrainType]
+    __buildings: dict[HexCoord, BuildingData]  # Kept apart from terrain; occupied only
+    __observers: dict[PowerObserver, None]  # Ordered set, in registration order
+    __positions_by_terrain: dict[TerrainType, set[HexCoord]]
+    __buildings_by_owner: dict[Name, set[HexCoord]]
+    __empty_positions: set[HexCoord]
+    __neighbors: dict[HexCoord, tuple[HexCoord, ...]]
+    __board_order: dict[HexCoord, int]  # Index of each position in board order
+    __area_parent: dict[HexCoord, HexCoord]  # Union-find over same-owner buildings
+    __area_size: dict[HexCoord, int]  # Group size, valid for group roots only
+    __largest_area: dict[Name, int]  # Largest group size per owner
+    __building_version: int  # Bumped on every building change
 
     def __new__(cls) -> Self:
         self = super().__new__(cls)
-        self.__grid = HexGrid[TerrainData]()
-        self.__observers = []
+        self.__grid = HexGrid[TerrainType]()
+        self.__buildings = {}
+        self.__observers = {}
+        self.__positions_by_terrain = {terrain: set() for terrain in TerrainType}
+        self.__buildings_by_owner = {}
+        self.__empty_positions = set()
+        self.__area_parent = {}
+        self.__area_size = {}
+        self.__largest_area = {}
+        self.__building_version = 0
         self._initialize_map()
         return self
 
@@ -64,38 +98,56 @@ class Board:
 
         for (q, r), terrain_type in terrain_pattern:
             coord = HexCoord(q, r)
-            terrain_data: TerrainData = {"terrain_type": terrain_type, "building": None}
-            self.__grid.set(coord, terrain_data)
+            self.__grid.set(coord, terrain_type)
+            self.__positions_by_terrain[terrain_type].add(coord)
+            self.__empty_positions.add(coord)
+
+        # Board positions never change, so adjacency is computed once up front
+        self.__neighbors = {
+            coord: tuple(
+                n for n in self.__grid.get_neighbors(coord) if n in self.__grid
+            )
+            for coord in self.__grid
+        }
+        self.__board_order = {coord: i for i, coord in enumerate(self.__grid)}
+
+    @property
+    def building_version(self) -> int:
+        """Counter incremented on every building change. Lets callers cache derived state."""
+        return self.__building_version
 
     # Core terrain and building management
 
-    def _get_terrain_data(self, coord: HexCoord) -> TerrainData:
-        """Get terrain data at coordinate with helpful error message.
+    def _outside_board(self, coord: HexCoord) -> ValueError:
+        """Build the error for a coordinate that is not on the board."""
+        return ValueError(f"Coordinate (q={coord.q}, r={coord.r}) is outside the board")
+
+    def get_terrain(self, coord: HexCoord) -> TerrainType:
+        """Get terrain type at the given coordinate.
 
         :raises ValueError: if coordinate is outside the board
         """
         try:
             return self.__grid.get(coord)
         except KeyError:
-            raise ValueError(
-                f"Coordinate (q={coord.q}, r={coord.r}) is outside the board"
-            ) from None
-
-    def get_terrain(self, coord: HexCoord) -> TerrainType:
-        """Get terrain type at the given coordinate."""
-        terrain_data = self._get_terrain_data(coord)
-        return terrain_data["terrain_type"]
+            raise self._outside_board(coord) from None
 
     def set_terrain(self, coord: HexCoord, terrain: TerrainType) -> None:
         """Set terrain type at the given coordinate."""
-        terrain_data = self._get_terrain_data(coord)
-        terrain_data["terrain_type"] = terrain
-        self.__grid.set(coord, terrain_data)
+        current = self.get_terrain(coord)
+        self.__positions_by_terrain[current].discard(coord)
+        self.__positions_by_terrain[terrain].add(coord)
+        self.__grid.set(coord, terrain)
 
     def get_building(self, coord: HexCoord) -> BuildingData | None:
-        """Get building at the given coordinate, or None if empty."""
-        terrain_data = self._get_terrain_data(coord)
-        return terrain_data["building"]
+        """Get building at the given coordinate, or None if empty.
+
+        :raises ValueError: if coordinate is outside the board
+        """
+        building = self.__buildings.get(coord)
+        if building is None and coord not in self.__grid:
+            raise self._outside_board(coord)
+        return building
 
     def set_building(
         self, coord: HexCoord, building_type: BuildingType, owner: Name
@@ -104,8 +156,9 @@ class Board:
         :raises ValueError: if coordinate is outside the board
         :raises ValueError: if position already has a building
         """
-        terrain_data = self._get_terrain_data(coord)
-        if terrain_data["building"] is not None:
+        if coord not in self.__grid:
+            raise self._outside_board(coord)
+        if coord in self.__buildings:
             raise ValueError(f"Position already has building: {coord}")
 
         building: BuildingData = {
@@ -113,19 +166,60 @@ class Board:
             "owner": owner,
             "position": coord,
         }
-        terrain_data["building"] = building
-        self.__grid.set(coord, terrain_data)
+        self.__buildings[coord] = building
+        self.__empty_positions.discard(coord)
+        owned = self.__buildings_by_owner.setdefault(owner, set())
+        owned.add(coord)
+        self._join_area(coord, owned, owner)
+        self.__building_version += 1
+
+    def _find_area_root(self, coord: HexCoord) -> HexCoord:
+        """Find the root of coord's building group, halving the path as it goes."""
+        parent = self.__area_parent
+        while parent[coord] is not coord:
+            parent[coord] = parent[parent[coord]]
+            coord = parent[coord]
+        return coord
+
+    def _join_area(self, coord: HexCoord, owned: set[HexCoord], owner: Name) -> None:
+        """Merge a new building into the groups of its same-owner neighbors.
+
+        Buildings are never removed, so groups only ever grow and the
+        largest area per owner can be kept as a running maximum.
+        """
+        parent = self.__area_parent
+        size = self.__area_size
+        parent[coord] = coord
+        size[coord] = 1
+        root = coord
+
+        for neighbor in self.get_valid_neighbors(coord):
+            if neighbor not in owned:
+                continue
+            other = self._find_area_root(neighbor)
+            if other is root:
+                continue
+            # Union by size: attach the smaller group under the larger
+            if size[other] > size[root]:
+                root, other = other, root
+            parent[other] = root
+            size[root] += size.pop(other)
+
+        if size[root] > self.__largest_area.get(owner, 0):
+            self.__largest_area[owner] = size[root]
 
     # Observer pattern for power gaining
 
     def add_observer(self, observer: PowerObserver) -> None:
         """Register an observer for building placement notifications."""
-        if observer not in self.__observers:
-            self.__observers.append(observer)
+        self.__observers[observer] = None
 
     def remove_observer(self, observer: PowerObserver) -> None:
         """Unregister an observer."""
-        self.__observers.remove(observer)
+        try:
+            del self.__observers[observer]
+        except KeyError:
+            raise ValueError(f"Observer not registered: {observer!r}") from None
 
     def notify_building_placed(
         self, coord: HexCoord, building_type: BuildingType, owner: Name
@@ -134,17 +228,13 @@ class Board:
         Notify all observers about a new building placement.
         Calculates power gain opportunities for adjacent opponents.
         """
-        # Get all adjacent buildings owned by other players
-        adjacent_buildings = self.get_adjacent_opponent_buildings(coord, owner)
+        if not self.__observers:
+            return
 
-        if not adjacent_buildings:
+        # Only notify when some other player has an adjacent building
+        if not self.get_adjacent_opponent_buildings(coord, owner):
             return  # No adjacent opponents
 
-        # Group buildings by owner
-        buildings_by_owner: dict[Name, list[BuildingData]] = {}
-        for building in adjacent_buildings:
-            buildings_by_owner.setdefault(building["owner"], []).append(building)
-
         # Notify each affected observer
         for observer in self.__observers:
             # Let the observer determine if they own any of these buildings
@@ -157,9 +247,15 @@ class Board:
         """Check if coordinate exists on the board."""
         return coord in self.__grid
 
-    def get_valid_neighbors(self, coord: HexCoord) -> list[HexCoord]:
+    def get_valid_neighbors(self, coord: HexCoord) -> tuple[HexCoord, ...]:
         """Get only neighboring coordinates that exist on the board."""
-        return [n for n in self.__grid.get_neighbors(coord) if n in self.__grid]
+        neighbors = self.__neighbors.get(coord)
+        if neighbors is None:
+            # Off-board coordinate: fall back to filtering its neighbors
+            return tuple(
+                n for n in self.__grid.get_neighbors(coord) if n in self.__grid
+            )
+        return neighbors
 
     def get_adjacent_opponent_buildings(
         self, coord: HexCoord, player: Name
@@ -176,14 +272,13 @@ class Board:
 
         return adjacent_buildings
 
+    def get_player_buildings(self, player: Name) -> AbstractSet[HexCoord]:
+        """Get the positions of all of a player's buildings."""
+        return self.__buildings_by_owner.get(player, frozenset())
+
     def find_connected_buildings(self, player: Name) -> list[set[HexCoord]]:
         """Find all groups of connected buildings for a player."""
-        player_buildings: set[HexCoord] = set()
-        for coord in self.__grid:
-            building = self.get_building(coord)
-            if building and building["owner"] == player:
-                player_buildings.add(coord)
-
+        player_buildings = self.__buildings_by_owner.get(player)
         if not player_buildings:
             return []
 
@@ -195,21 +290,19 @@ class Board:
             if start in visited:
                 continue
 
-            # BFS to find all connected buildings
-            component: set[HexCoord] = set()
-            queue = [start]
+            # BFS to find all connected buildings; mark visited on enqueue
+            visited.add(start)
+            component: set[HexCoord] = {start}
+            queue = deque([start])
 
             while queue:
-                current = queue.pop(0)
-                if current in visited:
-                    continue
-
-                visited.add(current)
-                component.add(current)
+                current = queue.popleft()
 
                 # Check all neighbors
                 for neighbor in self.get_valid_neighbors(current):
                     if neighbor in player_buildings and neighbor not in visited:
+                        visited.add(neighbor)
+                        component.add(neighbor)
                         queue.append(neighbor)
 
             components.append(component)
@@ -218,8 +311,7 @@ class Board:
 
     def get_largest_connected_area(self, player: Name) -> int:
         """Get the size of the player's largest connected building group. Used for area scoring at game end."""
-        components = self.find_connected_buildings(player)
-        return max(len(comp) for comp in components) if components else 0
+        return self.__largest_area.get(player, 0)
 
     def get_all_positions(self) -> list[HexCoord]:
         """Get all valid positions on the board."""
@@ -227,19 +319,13 @@ class Board:
 
     def get_empty_positions(self) -> list[HexCoord]:
         """Get all positions without buildings."""
-        empty = []
-        for coord in self.__grid:
-            if self.get_building(coord) is None:
-                empty.append(coord)
-        return empty
+        return sorted(self.__empty_positions, key=self.__board_order.__getitem__)
 
     def get_positions_with_terrain(self, terrain: TerrainType) -> list[HexCoord]:
         """Get all positions with the specified terrain type."""
-        positions = []
-        for coord in self.__grid:
-            if self.get_terrain(coord) == terrain:
-                positions.append(coord)
-        return positions
+        return sorted(
+            self.__positions_by_terrain[terrain], key=self.__board_order.__getitem__
+        )
 
     def __len__(self) -> int:
         """Number of positions on the board."""
@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import ClassVar, Self, final
-from weakref import WeakValueDictionary
 
 
 @final
@@ -10,16 +9,16 @@ class HexCoord:
     Immutable hexagonal coordinate using axial system (q, r).
     """
 
-    __instances: ClassVar[WeakValueDictionary[tuple[int, int], HexCoord]] = (
-        WeakValueDictionary()
-    )
-    # Flyweight pool for coordinate instances."""
+    __instances: ClassVar[dict[tuple[int, int], HexCoord]] = {}
+    # Flyweight pool for coordinate instances, keyed by (q, r). Board coordinates live for the whole game, so the pool holds strong references."""
 
-    __slots__ = ("__q", "__r", "__weakref__")
+    __slots__ = ("__q", "__r", "__s", "__hash")
     # TYPE: __slots__ restricts instance attributes to only these names. For memory efficiency and to prevent dynamic attributes.
 
     __q: int
     __r: int
+    __s: int
+    __hash: int  # Computed once; instances are immutable
 
     def __new__(cls, q: int, r: int) -> Self:
         """Factory constructor implementing flyweight pattern. Returns existing instance if coordinates already exist."""
@@ -30,6 +29,8 @@ class HexCoord:
             instance = super().__new__(cls)
             instance.__q = q
             instance.__r = r
+            instance.__s = -q - r
+            instance.__hash = hash(key)
             HexCoord.__instances[key] = instance
 
         return instance
@@ -44,12 +45,17 @@ class HexCoord:
         """The r component of axial coordinates."""
         return self.__r
 
+    @property
+    def s(self) -> int:
+        """The derived cube component, s = -q - r. Stored once at creation."""
+        return self.__s
+
     def __eq__(self, other: object) -> bool:
-        """Equality based on coordinates."""
+        """Equality based on coordinates. The flyweight pool guarantees one instance per coordinate, so identity suffices."""
         if not isinstance(other, HexCoord):
             return NotImplemented
-        return self.__q == other.__q and self.__r == other.__r
+        return self is other
 
     def __hash__(self) -> int:
         """Hash based on coordinates for use in sets and dicts."""
-        return hash((self.__q, self.__r))
+        return self.__hash
@@ -8,8 +8,11 @@ class BaseFactionAbility(FactionAbility):
     PATTERN: Strategy pattern.
     Base implementation of faction abilities with defaults.
     Subclasses override methods to provide faction-specific modifications.
+    Abilities are stateless, so a single shared instance per faction is enough.
     """
 
+    __slots__ = ()
+
     def modify_terrain_cost(self, base_cost: SpadeCount) -> SpadeCount:
         """Default: no modification."""
         return base_cost
@@ -22,12 +25,14 @@ class BaseFactionAbility(FactionAbility):
 class WitchesAbility(BaseFactionAbility):
     """Simplified from full Terra Mystica: Witches have no special abilities."""
 
-    pass  # Uses default implementations from BaseFactionAbility
+    __slots__ = ()  # Uses default implementations from BaseFactionAbility
 
 
 class EngineersAbility(BaseFactionAbility):
     """Engineers: Simplifictation - build at half cost"""
 
+    __slots__ = ()
+
     def modify_building_cost(self, base_cost: ResourceCost) -> ResourceCost:
         return {
             "workers": base_cost.get("workers", 0) // 2,
@@ -40,6 +45,8 @@ class EngineersAbility(BaseFactionAbility):
 class NomadsAbility(BaseFactionAbility):
     """Nomads: Simplification - transform terrain costs 1 less spade (minimum 1)"""
 
+    __slots__ = ()
+
     def modify_terrain_cost(self, base_cost: SpadeCount) -> SpadeCount:
         """Reduce terrain transformation cost by 1."""
         return max(1, base_cost - 1)
@@ -50,3 +57,8 @@ ABILITY_CLASSES: Final[dict[FactionType, Type[FactionAbility]]] = {
     FactionType.ENGINEERS: EngineersAbility,
     FactionType.NOMADS: NomadsAbility,
 }
+
+FACTION_ABILITIES: Final[dict[FactionType, FactionAbility]] = {
+    faction: ability_class() for faction, ability_class in ABILITY_CLASSES.items()
+}
+"""PATTERN: Flyweight - one shared ability instance per faction, created once."""
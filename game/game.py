@@ -1,4 +1,7 @@
 from __future__ import annotations
+import heapq
+from collections import deque
+from collections.abc import Callable
 from typing import Self
 
 from .actions import ActionBuilder, ActionFactory
@@ -8,8 +11,8 @@ from .game_types import (
     DEFAULT_SCORING,
     FactionType,
     GameAction,
-    GameState,
     Name,
+    PassAction,
     PlayerView,
     VictoryPoints,
 )
@@ -42,14 +45,33 @@ class Game:
         bob.pass_turn()  # Pass for the round
     """
 
+    __slots__ = (
+        "__board",
+        "__players",
+        "__player_map",
+        "__seat_index",
+        "__turn_order",
+        "__pass_order",
+        "__current_round",
+        "__is_finished",
+        "__winner",
+        "__max_rounds",
+        "__action_builders",
+        "__board_state_cache",
+    )
+
     __board: Board
     __players: list[Player]
     __player_map: dict[Name, Player]
-    __active_players: set[Name]
+    __seat_index: dict[Name, int]  # Position of each player in __players
+    __turn_order: deque[Player]  # Active players this round, current player first
     __pass_order: list[Name]  # Track order of passing for next round
-    __game_state: GameState
+    __current_round: int
+    __is_finished: bool
+    __winner: Name | None
     __max_rounds: int
     __action_builders: dict[Name, ActionBuilder]
+    __board_state_cache: tuple[int, dict[str, list[tuple[int, int]]]] | None
 
     def __new__(cls, max_rounds: int = 10) -> Self:
         """
@@ -71,16 +93,15 @@ class Game:
         self.__board = Board()
         self.__players = []
         self.__player_map = {}
-        self.__active_players = set()
+        self.__seat_index = {}
+        self.__turn_order = deque()
         self.__pass_order = []
-        self.__game_state = {
-            "current_player_index": 0,
-            "current_round": 1,
-            "is_finished": False,
-            "winner": None,
-        }
+        self.__current_round = 1
+        self.__is_finished = False
+        self.__winner = None
         self.__max_rounds = max_rounds
         self.__action_builders = {}
+        self.__board_state_cache = None
         return self
 
     # Player management
@@ -101,7 +122,7 @@ class Game:
         Raises:
             ValueError: If game already started, player exists, or faction taken
         """
-        if self.__game_state["current_round"] > 1:
+        if self.__current_round > 1:
             raise ValueError("Cannot add players after game starts")
 
         if name in self.__player_map:
@@ -114,14 +135,16 @@ class Game:
 
         # Check faction not already taken
         for player in self.__players:
-            if player.faction == faction_type:
+            if player.faction is faction_type:
                 raise ValueError(f"Faction already taken: {faction}")
 
         # Create player
         player = Player(name, faction_type, self.__board)
         self.__players.append(player)
         self.__player_map[name] = player
-        self.__active_players.add(name)  # New player is active
+        self.__seat_index[name] = len(self.__players) - 1
+        # New player is active; keep the current player at the front
+        self._reset_turn_order(self.__turn_order[0] if self.__turn_order else player)
 
         # Create action builder for player
         with ActionBuilder._constructing_builder():
@@ -143,9 +166,11 @@ class Game:
         Raises:
             KeyError: If player doesn't exist
         """
-        if name not in self.__action_builders:
-            raise KeyError(f"Unknown player: {name}")
-        return self.__action_builders[name]
+        # Builders are created once in add_player; this is a single lookup
+        try:
+            return self.__action_builders[name]
+        except KeyError:
+            raise KeyError(f"Unknown player: {name}") from None
 
     @property
     def players(self) -> list[str]:
@@ -160,28 +185,27 @@ class Game:
         Raises:
             ValueError: If game is finished or no players exist
         """
-        if self.__game_state["is_finished"]:
+        if self.__is_finished:
             raise ValueError("Game is finished")
         if not self.__players:
             raise ValueError("No players in game")
 
-        idx = self.__game_state["current_player_index"]
-        return self.__players[idx].name
+        return self.__turn_order[0].name
 
     @property
     def is_finished(self) -> bool:
         """Whether the game has ended."""
-        return self.__game_state["is_finished"]
+        return self.__is_finished
 
     @property
     def current_round(self) -> int:
         """Current round number (1-based)."""
-        return self.__game_state["current_round"]
+        return self.__current_round
 
     @property
     def rounds_remaining(self) -> int:
         """Number of rounds left before game ends."""
-        return max(0, self.__max_rounds - self.__game_state["current_round"])
+        return max(0, self.__max_rounds - self.__current_round)
 
     # Action execution
 
@@ -201,71 +225,110 @@ class Game:
         Raises:
             ValueError: If game finished, not player's turn, or action invalid
         """
-        if self.__game_state["is_finished"]:
+        if self.__is_finished:
             raise ValueError("Game is finished")
 
-        if len(self.__players) < 2 or len(self.__players) > 3:
+        num_players = len(self.__players)
+        if num_players < 2 or num_players > 3:
             raise ValueError(
                 "Need 2 or 3 players to start"
             )  # Since we only have 3 factions
 
-        current = self.__players[self.__game_state["current_player_index"]]
-        if action["player"] not in self.__active_players:
-            raise ValueError(
-                f"{action['player']} has passed for the rest of the round, it's {current.name}'s turn"
-            )
-        if action["player"] != current.name:
-            raise ValueError(
-                f"Not {action['player']}'s turn, it's {current.name}'s turn"
-            )
+        turn_order = self.__turn_order
+        current = turn_order[0]
+        actor = action["player"]
+        if actor != current.name:
+            if all(player.name != actor for player in turn_order):
+                raise ValueError(
+                    f"{actor} has passed for the rest of the round, it's {current.name}'s turn"
+                )
+            raise ValueError(f"Not {actor}'s turn, it's {current.name}'s turn")
 
         # Create and execute action
         executor = ActionFactory.create_executor(action, self.__board, current)
         executor.execute(action)
 
         # Handle passing
-        if action["action"] == "pass":
-            self._handle_pass(current.name)
+        passed = action["action"] == "pass"
+        if not passed and not self._has_valid_actions(current):
+            # Forced pass (no valid actions)
+            current.mark_passed()
+            passed = True
+
+        if passed:
+            self._handle_pass()
         else:
-            # Check for forced pass (no valid actions)
-            if not self._has_valid_actions(current):
-                current.mark_passed()
-                self._handle_pass(current.name)
+            # Current player moves to the back of this round's turn order
+            turn_order.rotate(-1)
 
-        if not self.__game_state["is_finished"]:
-            if len(self.__active_players) == 0:
+        if not self.__is_finished:
+            if not turn_order:
                 # All passed - start new round
                 self._start_new_round()
             else:
                 # Continue to next active player
-                self._advance_to_next_active_player()
+                turn_order[0].start_turn()
 
-    def _handle_pass(self, player_name: Name) -> None:
-        """Handle a player passing."""
-        self.__active_players.discard(player_name)
-        self.__pass_order.append(player_name)
+    def can_execute(self, action: GameAction) -> bool:
+        """
+        Check whether a game action would succeed for the current player.
 
-    def _advance_to_next_active_player(self) -> None:
-        """Find and activate the next player who hasn't passed."""
-        player_count = len(self.__players)
-        if player_count == 0:
-            return
+        Runs the same checks as execute_action but returns False instead of
+        raising, so callers can probe actions without exception handling.
 
-        # Start from current position
-        current_idx = self.__game_state["current_player_index"]
+        Args:
+            action: Action to check (build, transform, power, or pass)
 
-        # Look for next active player
-        for _ in range(player_count):
-            current_idx = (current_idx + 1) % player_count
-            player = self.__players[current_idx]
+        Returns:
+            True if execute_action would accept the action
+        """
+        if self.__is_finished:
+            return False
+        num_players = len(self.__players)
+        if num_players < 2 or num_players > 3:
+            return False
 
-            if player.name in self.__active_players:
-                self.__game_state["current_player_index"] = current_idx
-                player.start_turn()
-                return
+        current = self.__turn_order[0]
+        if action["player"] != current.name:
+            return False
 
-        # Shouldn't reach here if active_players is tracked correctly
-        raise RuntimeError("No active players found but round hasn't ended")
+        try:
+            executor = ActionFactory.create_executor(action, self.__board, current)
+        except ValueError:
+            return False  # Unknown action kind
+        return executor.can_execute(action)
+
+    def fast_forward(self, until: Callable[[Game], bool]) -> None:
+        """
+        Pass turns for the current player until a condition holds.
+
+        Convenience for skipping ahead (e.g. to a later round) without an
+        ActionBuilder call per turn; each pass still goes through
+        execute_action. Stops early if the game finishes.
+
+        Args:
+            until: Predicate checked against the game before each pass
+
+        Raises:
+            ValueError: If the game cannot be played (e.g. too few players)
+        """
+        execute = self.execute_action
+
+        while not self.__is_finished and not until(self):
+            action: PassAction = {"action": "pass", "player": self.current_player}
+            execute(action)
+
+    def _handle_pass(self) -> None:
+        """Handle the current player passing: they leave this round's turn order."""
+        player = self.__turn_order.popleft()
+        self.__pass_order.append(player.name)
+
+    def _reset_turn_order(self, first: Player) -> None:
+        """Queue the players who have not passed in seating order, starting with first."""
+        start = self.__seat_index[first.name]
+        seating = self.__players[start:] + self.__players[:start]
+        self.__turn_order.clear()
+        self.__turn_order.extend(p for p in seating if not p.has_passed)
 
     def _start_new_round(self) -> None:
         """
@@ -275,39 +338,30 @@ class Game:
         who passed first in the previous round.
         """
         # Increment round
-        self.__game_state["current_round"] += 1
+        self.__current_round += 1
 
         # Check end game
-        if self.__game_state["current_round"] >= self.__max_rounds:
+        if self.__current_round >= self.__max_rounds:
             self._end_game()
             return
 
         for player in self.__players:
             player.reset_for_new_round()
 
-        # Reactivate all players
-        self.__active_players = {p.name for p in self.__players}
-
-        # Determine turn order based on pass order
+        # Reactivate all players, in turn order based on pass order
         if self.__pass_order:
             # First player to pass gets first turn next round
-            first_player_name = self.__pass_order[0]
-            # Find their index
-            for i, player in enumerate(self.__players):
-                if player.name == first_player_name:
-                    self.__game_state["current_player_index"] = i
-                    break
+            first_player = self.__player_map[self.__pass_order[0]]
         else:
             # No one passed (shouldn't happen), keep same order
-            self.__game_state["current_player_index"] = 0
+            first_player = self.__players[0]
+        self._reset_turn_order(first_player)
 
         # Clear pass order for next round
         self.__pass_order.clear()
 
         # Start the first player's turn
-        if self.__players:
-            current = self.__players[self.__game_state["current_player_index"]]
-            current.start_turn()
+        self.__turn_order[0].start_turn()
 
     def _has_valid_actions(self, player: Player) -> bool:
         """
@@ -320,12 +374,8 @@ class Game:
         if player.has_passed:
             return False
 
-        # Check for any affordable action
-        has_workers = player.workers > 0
-        has_coins = player.coins > 0
-        has_power = player.available_power >= 3
-
-        return has_workers or has_coins or has_power
+        # Check for any affordable action; stops at the first resource found
+        return player.workers > 0 or player.coins > 0 or player.available_power >= 3
 
     def _end_game(self) -> None:
         """
@@ -333,7 +383,7 @@ class Game:
 
         Calculates final scores including area bonuses and declares winner.
         """
-        self.__game_state["is_finished"] = True
+        self.__is_finished = True
 
         # Calculate final scores
         scores = self._calculate_final_scores()
@@ -341,7 +391,7 @@ class Game:
         # Determine winner
         if scores:
             winner_name = max(scores.items(), key=lambda item: item[1])[0]
-            self.__game_state["winner"] = winner_name
+            self.__winner = winner_name
 
     def _calculate_final_scores(self) -> dict[Name, VictoryPoints]:
         """
@@ -353,8 +403,10 @@ class Game:
         - Area scoring for largest connected groups
         """
         scores: dict[Name, VictoryPoints] = {}
+        area_sizes: list[tuple[Name, int]] = []
         scoring = DEFAULT_SCORING
 
+        # Single pass over players collects every score component
         for player in self.__players:
             # Base VP
             vp = player.victory_points
@@ -364,20 +416,20 @@ class Game:
             vp += total_coins // scoring["coins_per_vp"]
             scores[player.name] = vp
 
-        # Area scoring
-        area_sizes = [
-            (p.name, self.__board.get_largest_connected_area(p.name))
-            for p in self.__players
-        ]
-        area_sizes.sort(key=lambda x: x[1], reverse=True)
+            # Area size, ranked below
+            area = self.__board.get_largest_connected_area(player.name)
+            area_sizes.append((player.name, area))
+
+        # Area scoring: only the top three areas are awarded
+        top = heapq.nlargest(3, area_sizes, key=lambda x: x[1])
 
         # Award area bonuses
-        if len(area_sizes) >= 1 and area_sizes[0][1] > 0:
-            scores[area_sizes[0][0]] += scoring["area_first_place"]
-        if len(area_sizes) >= 2 and area_sizes[1][1] > 0:
-            scores[area_sizes[1][0]] += scoring["area_second_place"]
-        if len(area_sizes) >= 3 and area_sizes[2][1] > 0:
-            scores[area_sizes[2][0]] += scoring["area_third_place"]
+        if len(top) >= 1 and top[0][1] > 0:
+            scores[top[0][0]] += scoring["area_first_place"]
+        if len(top) >= 2 and top[1][1] > 0:
+            scores[top[1][0]] += scoring["area_second_place"]
+        if len(top) >= 3 and top[2][1] > 0:
+            scores[top[2][0]] += scoring["area_third_place"]
 
         return scores
 
@@ -407,7 +459,7 @@ class Game:
         Returns:
             Dict of player names to final scores, or None if game not finished
         """
-        if not self.__game_state["is_finished"]:
+        if not self.__is_finished:
             return None
         return self._calculate_final_scores()
 
@@ -418,18 +470,28 @@ class Game:
         Returns:
             Name of winning player, or None if game not finished
         """
-        return self.__game_state["winner"]
+        return self.__winner
 
     def get_board_state(self) -> dict[str, list[tuple[int, int]]]:
         """
         Get positions of all buildings by player.
         Used for visualizing the game state or debugging.
 
+        The result is cached until a building is placed; each call returns
+        a fresh copy.
+
         Returns:
             Dict mapping player names to their building coordinates
         """
+        version = self.__board.building_version
+        if self.__board_state_cache is not None:
+            cached_version, cached_state = self.__board_state_cache
+            if cached_version == version:
+                return {name: list(coords) for name, coords in cached_state.items()}
+
         positions_by_player: dict[str, list[tuple[int, int]]] = {}
 
+        # Board order, so owners and their positions appear as on the board
         for coord in self.__board.get_all_positions():
             building = self.__board.get_building(coord)
             if building:
@@ -438,4 +500,5 @@ class Game:
                     positions_by_player[owner] = []
                 positions_by_player[owner].append((coord.q, coord.r))
 
-        return positions_by_player
+        self.__board_state_cache = (version, positions_by_player)
+        return {name: list(coords) for name, coords in positions_by_player.items()}
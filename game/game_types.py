@@ -64,15 +64,6 @@ class PowerActionType(Enum):
     GAIN_WORKERS = "gain_workers"  # Cost: 3 power, gain 2 workers
 
 
-class GameState(TypedDict):
-    """TYPE: TypedDict for game state tracking."""
-
-    current_player_index: int
-    current_round: int
-    is_finished: bool
-    winner: Name | None
-
-
 # Constants
 SPADE_EXCHANGE_RATE: Final[int] = 3  # workers per spade
 POWER_GAIN_VP_LOSS: Final[int] = 1  # VP lost per power gained - 1
@@ -92,6 +83,16 @@ TERRAIN_CYCLE: Final[list[TerrainType]] = [
 ]
 """Cycle of terrain types. Can be extended for additional terrains."""
 
+TERRAIN_DISTANCES: Final[dict[tuple[TerrainType, TerrainType], SpadeCount]] = {
+    (from_terrain, to_terrain): min(
+        (to_idx - from_idx) % len(TERRAIN_CYCLE),
+        (from_idx - to_idx) % len(TERRAIN_CYCLE),
+    )
+    for from_idx, from_terrain in enumerate(TERRAIN_CYCLE)
+    for to_idx, to_terrain in enumerate(TERRAIN_CYCLE)
+}
+"""Spades needed between each pair of terrains (shortest way round the cycle), computed once."""
+
 BUILDING_COSTS: Final[dict[BuildingType, "ResourceCost"]] = {
     BuildingType.DWELLING: {"workers": 1, "coins": 2},
 }
@@ -148,13 +149,6 @@ class BuildingData(TypedDict):
     position: HexCoord
 
 
-class TerrainData(TypedDict):
-    """TYPE: TypedDict for terrain hex data."""
-
-    terrain_type: TerrainType
-    building: BuildingData | None
-
-
 class PlayerView(TypedDict):
     """TYPE: TypedDict for read-only player data."""
 
@@ -212,6 +206,8 @@ class FactionAbility(Protocol):
     Each faction implements this to provide unique abilities.
     """
 
+    __slots__ = ()
+
     def modify_terrain_cost(self, base_cost: SpadeCount) -> SpadeCount:
         """Modify the cost to transform terrain."""
         ...
@@ -226,6 +222,8 @@ class ActionExecutor(Protocol):
     TYPE: Protocol for action execution.
     """
 
+    __slots__ = ()
+
     def execute(self, action: GameAction) -> None:
         """Execute the action, modifying game state."""
         ...
@@ -234,12 +232,18 @@ class ActionExecutor(Protocol):
         """Calculate the cost of executing the action."""
         ...
 
+    def can_execute(self, action: GameAction) -> bool:
+        """Check if the action could be executed, without raising."""
+        ...
+
 
 class PowerObserver(Protocol):
     """PATTERN: Observer pattern for power gain notifications.
     TYPE: Protocol for event handling.
     """
 
+    __slots__ = ()
+
     def notify_adjacent_building(
         self,
         builder: Name,
@@ -251,14 +255,14 @@ class PowerObserver(Protocol):
 
 
 def is_gain_spades_action(action: PowerAction) -> TypeGuard[PowerAction]:
-    return action["power_action"] == PowerActionType.GAIN_SPADES
+    return action["power_action"] is PowerActionType.GAIN_SPADES
 
 
 """TYPE: TypeGuard for gain spades action type narrowing."""
 
 
 def is_gain_workers_action(action: PowerAction) -> TypeGuard[PowerAction]:
-    return action["power_action"] == PowerActionType.GAIN_WORKERS
+    return action["power_action"] is PowerActionType.GAIN_WORKERS
 
 
 """TYPE: TypeGuard for gain workers action type narrowing."""
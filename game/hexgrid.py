@@ -1,11 +1,56 @@
 from __future__ import annotations
 from collections.abc import Callable, Iterable, Iterator
-from typing import Generic, Self, TypeVar
+from typing import Final, Generic, Self, TypeVar, cast
 
 from .coords import HexCoord
 
 T = TypeVar("T")
 
+_MISSING: Final = object()
+"""Sentinel for absent cells, so a single dict probe distinguishes them from stored None values."""
+
+_NEIGHBOR_OFFSETS: Final[tuple[tuple[int, int], ...]] = (
+    (1, 0),  # East
+    (0, 1),  # Southeast
+    (-1, 1),  # Southwest
+    (-1, 0),  # West
+    (0, -1),  # Northwest
+    (1, -1),  # Northeast
+)
+"""Axial (dq, dr) offsets of the six neighbors, in get_neighbors order."""
+
+_NEIGHBOR_CACHE: dict[HexCoord, tuple[HexCoord, ...]] = {}
+"""Neighbors of every coordinate asked about so far. HexCoords are immutable flyweights, so entries never go stale."""
+
+
+def _neighbors_of(coord: HexCoord) -> tuple[HexCoord, ...]:
+    """Returns the cached neighbors of coord, building them on first use."""
+    neighbors = _NEIGHBOR_CACHE.get(coord)
+    if neighbors is None:
+        q, r = coord.q, coord.r
+        # These will reuse existing HexCoord instances via flyweight
+        neighbors = tuple(HexCoord(q + dq, r + dr) for dq, dr in _NEIGHBOR_OFFSETS)
+        _NEIGHBOR_CACHE[coord] = neighbors
+    return neighbors
+
+
+_RANGE_OFFSETS: dict[int, tuple[tuple[int, int], ...]] = {}
+"""(dq, dr) offsets of every hex within a radius, computed once per radius."""
+
+
+def _range_offsets(radius: int) -> tuple[tuple[int, int], ...]:
+    """Returns the cached range offsets for radius, enumerating them on first use."""
+    offsets = _RANGE_OFFSETS.get(radius)
+    if offsets is None:
+        # Use cube coordinates for cleaner range calculation
+        offsets = tuple(
+            (q, r)
+            for q in range(-radius, radius + 1)
+            for r in range(max(-radius, -q - radius), min(radius, -q + radius) + 1)
+        )
+        _RANGE_OFFSETS[radius] = offsets
+    return offsets
+
 
 class HexGrid(Generic[T]):
     """DATASTRUCT
@@ -14,6 +59,14 @@ class HexGrid(Generic[T]):
     The grid uses axial coordinates (q, r) with flyweight pattern and can store any type T at each position.
     """
 
+    __slots__ = (
+        "__cells",
+        "__min_q",
+        "__max_q",
+        "__min_r",
+        "__max_r",
+    )
+
     __cells: dict[HexCoord, T]
     """The sparse storage for hex positions and their values."""
 
@@ -48,14 +101,25 @@ class HexGrid(Generic[T]):
 
     def set(self, coord: HexCoord, value: T) -> None:
         """Sets the value at the given hex coordinate.Also updates the grid boundaries for efficient range queries."""
-        self.__cells[coord] = value
+        cells = self.__cells
+        was_empty = not cells
+        existed = coord in cells
+        cells[coord] = value
 
-        # Update boundaries
-        if coord not in self.__cells or len(self.__cells) == 1:
-            self.__min_q = min(self.__min_q, coord.q)
-            self.__max_q = max(self.__max_q, coord.q)
-            self.__min_r = min(self.__min_r, coord.r)
-            self.__max_r = max(self.__max_r, coord.r)
+        # Update boundaries; checked before the insert so new positions are detected
+        q, r = coord.q, coord.r
+        if was_empty:
+            self.__min_q = self.__max_q = q
+            self.__min_r = self.__max_r = r
+        elif not existed:
+            if q < self.__min_q:
+                self.__min_q = q
+            elif q > self.__max_q:
+                self.__max_q = q
+            if r < self.__min_r:
+                self.__min_r = r
+            elif r > self.__max_r:
+                self.__max_r = r
 
     def remove(self, coord: HexCoord) -> T:
         """Removes and returns the value at the given hex coordinate."""
@@ -78,28 +142,29 @@ class HexGrid(Generic[T]):
 
     def get_neighbors(self, coord: HexCoord) -> list[HexCoord]:
         """Returns all 6 neighboring hex coordinates. Neighbors are returned in order: E, SE, SW, W, NW, NE"""
-        q, r = coord.q, coord.r
-        # These will reuse existing HexCoord instances via flyweight
-        return [
-            HexCoord(q + 1, r),  # East
-            HexCoord(q, r + 1),  # Southeast
-            HexCoord(q - 1, r + 1),  # Southwest
-            HexCoord(q - 1, r),  # West
-            HexCoord(q, r - 1),  # Northwest
-            HexCoord(q + 1, r - 1),  # Northeast
-        ]
+        return list(_neighbors_of(coord))
 
     def get_filled_neighbors(self, coord: HexCoord) -> list[tuple[HexCoord, T]]:
         """Returns neighbors that have values as (coordinate, value) pairs."""
+        cells = self.__cells
         result = []
-        for neighbor in self.get_neighbors(coord):
-            if neighbor in self:
-                result.append((neighbor, self.__cells[neighbor]))
+        for neighbor in _neighbors_of(coord):
+            value = cells.get(neighbor, _MISSING)
+            if value is not _MISSING:
+                result.append((neighbor, cast(T, value)))
         return result
 
     def distance(self, a: HexCoord, b: HexCoord) -> int:
         """Calculates the hexagonal distance between two coordinates. Uses the hexagonal Manhattan distance formula."""
-        return (abs(a.q - b.q) + abs(a.q + a.r - b.q - b.r) + abs(a.r - b.r)) // 2
+        dq = a.q - b.q
+        dr = a.r - b.r
+        ds = dq + dr
+        # Inline absolute values avoid three builtin calls
+        return (
+            (dq if dq >= 0 else -dq)
+            + (dr if dr >= 0 else -dr)
+            + (ds if ds >= 0 else -ds)
+        ) >> 1
 
     def get_range(self, center: HexCoord, radius: int) -> list[HexCoord]:
         """
@@ -113,23 +178,20 @@ class HexGrid(Generic[T]):
         if radius == 0:
             return [center]
 
-        results = []
-        # Use cube coordinates for cleaner range calculation
-        for q in range(-radius, radius + 1):
-            for r in range(max(-radius, -q - radius), min(radius, -q + radius) + 1):
-                # Flyweight pattern ensures we reuse existing coords
-                results.append(HexCoord(center.q + q, center.r + r))
-
-        return results
+        cq, cr = center.q, center.r
+        # Flyweight pattern ensures we reuse existing coords
+        return [HexCoord(cq + dq, cr + dr) for dq, dr in _range_offsets(radius)]
 
     def get_filled_range(
         self, center: HexCoord, radius: int
     ) -> list[tuple[HexCoord, T]]:
         """Returns all filled positions within radius as (coordinate, value) pairs."""
+        cells = self.__cells
         results = []
         for coord in self.get_range(center, radius):
-            if coord in self:
-                results.append((coord, self.__cells[coord]))
+            value = cells.get(coord, _MISSING)
+            if value is not _MISSING:
+                results.append((coord, cast(T, value)))
         return results
 
     def find_path(
@@ -145,32 +207,74 @@ class HexGrid(Generic[T]):
         :param is_passable: Optional function to test if a hex can be traversed
         :return: List of coordinates from start to end, or None if no path exists
         """
-        from collections import deque
-
         if start == end:
             return [start]
 
-        # BFS for shortest path
-        queue = deque([(start, [start])])
-        visited = {start}
-
-        while queue:
-            current, path = queue.popleft()
+        if is_passable is not None and not is_passable(end):
+            return None
+
+        # Bidirectional BFS: grow the smaller frontier one level at a time until
+        # the searches meet. Parent maps double as visited sets.
+        forward: dict[HexCoord, HexCoord | None] = {start: None}
+        backward: dict[HexCoord, HexCoord | None] = {end: None}
+        forward_level = [start]
+        backward_level = [end]
+
+        while forward_level and backward_level:
+            if len(forward_level) <= len(backward_level):
+                forward_level, meeting = self._expand_level(
+                    forward_level, forward, backward, is_passable
+                )
+            else:
+                backward_level, meeting = self._expand_level(
+                    backward_level, backward, forward, is_passable
+                )
+
+            if meeting is not None:
+                return self._trace(meeting, forward)[::-1] + self._trace(
+                    backward[meeting], backward
+                )
+
+        # One side ran out of hexes without meeting the other
+        return None
 
-            for neighbor in self.get_neighbors(current):
-                if neighbor in visited:
+    def _expand_level(
+        self,
+        level: list[HexCoord],
+        parents: dict[HexCoord, HexCoord | None],
+        other_parents: dict[HexCoord, HexCoord | None],
+        is_passable: Callable[[HexCoord], bool] | None,
+    ) -> tuple[list[HexCoord], HexCoord | None]:
+        """Expands one BFS level. Returns the next level and the hex where it met the other search, if any."""
+        next_level: list[HexCoord] = []
+        for current in level:
+            for neighbor in _neighbors_of(current):
+                if neighbor in parents:
                     continue
 
+                # Checked before passability: the other search already accepted it
+                if neighbor in other_parents:
+                    parents[neighbor] = current
+                    return next_level, neighbor
+
                 if is_passable is not None and not is_passable(neighbor):
                     continue
 
-                if neighbor == end:
-                    return path + [neighbor]
-
-                visited.add(neighbor)
-                queue.append((neighbor, path + [neighbor]))
-
-        return None
+                parents[neighbor] = current
+                next_level.append(neighbor)
+
+        return next_level, None
+
+    @staticmethod
+    def _trace(
+        coord: HexCoord | None, parents: dict[HexCoord, HexCoord | None]
+    ) -> list[HexCoord]:
+        """Follows parent links from coord back to the search root."""
+        path = []
+        while coord is not None:
+            path.append(coord)
+            coord = parents[coord]
+        return path
 
     def __len__(self) -> int:
         """Returns the number of filled positions in the grid."""
@@ -1,16 +1,19 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Self
+from collections.abc import Callable
+from typing import TYPE_CHECKING, ClassVar, Self
 
 from .coords import HexCoord
-from .faction import ABILITY_CLASSES
+from .faction import FACTION_ABILITIES
 from .power import PowerManager
 from .game_types import (
+    BUILDING_COSTS,
     BUILDING_POWER_VALUES,
     FACTION_HOME_TERRAIN,
     FACTION_STARTING_RESOURCES,
     INCOME_FREQUENCY,
     POWER_GAIN_VP_LOSS,
     SPADE_EXCHANGE_RATE,
+    TERRAIN_DISTANCES,
     BuildingType,
     FactionAbility,
     FactionType,
@@ -19,6 +22,7 @@ from .game_types import (
     PowerObserver,
     ResourceCost,
     ResourceState,
+    SpadeCount,
     TerrainType,
     VictoryPoints,
 )
@@ -33,10 +37,31 @@ class Player(PowerObserver):
     TYPE: Composition - has PowerManager and FactionAbility
     """
 
+    __slots__ = (
+        "__name",
+        "__faction",
+        "__faction_ability",
+        "__transform_costs",
+        "__building_costs",
+        "__workers",
+        "__coins",
+        "__power_manager",
+        "__victory_points",
+        "__buildings_on_board",
+        "__has_passed",
+        "__spades_available",
+        "__board",
+        "__turn_count",
+        "__adjacent_power",
+    )
+
     __name: Name
     __faction: FactionType
     __faction_ability: FactionAbility
-    __resources: ResourceState
+    __transform_costs: dict[tuple[TerrainType, TerrainType], SpadeCount]
+    __building_costs: dict[BuildingType, ResourceCost]
+    __workers: int
+    __coins: int
     __power_manager: PowerManager
     __victory_points: VictoryPoints
     __buildings_on_board: list[HexCoord]
@@ -44,6 +69,7 @@ class Player(PowerObserver):
     __spades_available: int
     __board: Board
     __turn_count: int  # Track turns for income
+    __adjacent_power: dict[HexCoord, int]  # Own building power next to each hex
 
     def __new__(cls, name: Name, faction: FactionType, board: Board) -> Self:
         self = super().__new__(cls)
@@ -51,18 +77,28 @@ class Player(PowerObserver):
         self.__faction = faction
         self.__board = board
 
-        # Initialize faction ability using factory
-        ability_class = ABILITY_CLASSES[faction]
-        self.__faction_ability = ability_class()
+        # Faction abilities are stateless, so players share one instance
+        self.__faction_ability = FACTION_ABILITIES[faction]
+        # Terrain pairs and building costs are fixed, so faction-adjusted costs are computed once
+        self.__transform_costs = {
+            terrains: self.__faction_ability.modify_terrain_cost(distance)
+            for terrains, distance in TERRAIN_DISTANCES.items()
+        }
+        self.__building_costs = {
+            building_type: self.__faction_ability.modify_building_cost(cost.copy())
+            for building_type, cost in BUILDING_COSTS.items()
+        }
 
         # Initialize resources from faction defaults
         starting_resources = FACTION_STARTING_RESOURCES[faction]
-        self.__resources = starting_resources.copy()
+        self.__workers = starting_resources["workers"]
+        self.__coins = starting_resources["coins"]
 
         # Initialize other state
         self.__power_manager = PowerManager()
         self.__victory_points = 20  # Starting VP as per Terra Mystica
         self.__buildings_on_board = []
+        self.__adjacent_power = {}
         self.__has_passed = False
         self.__spades_available = 0
         self.__turn_count = 0
@@ -88,15 +124,15 @@ class Player(PowerObserver):
 
     @property
     def resources(self) -> ResourceState:
-        return self.__resources.copy()
+        return {"workers": self.__workers, "coins": self.__coins}
 
     @property
     def workers(self) -> int:
-        return self.__resources["workers"]
+        return self.__workers
 
     @property
     def coins(self) -> int:
-        return self.__resources["coins"]
+        return self.__coins
 
     @property
     def available_power(self) -> int:
@@ -126,6 +162,16 @@ class Player(PowerObserver):
     def home_terrain(self) -> TerrainType:
         return FACTION_HOME_TERRAIN[self.__faction]
 
+    def transform_cost(
+        self, from_terrain: TerrainType, to_terrain: TerrainType
+    ) -> SpadeCount:
+        """Spades this player needs to transform between terrains, after faction ability."""
+        return self.__transform_costs[(from_terrain, to_terrain)]
+
+    def building_cost(self, building_type: BuildingType) -> ResourceCost:
+        """Resources this player needs to build, after faction ability."""
+        return self.__building_costs[building_type].copy()
+
     # Resource management
 
     def can_afford(self, cost: ResourceCost) -> bool:
@@ -134,9 +180,9 @@ class Player(PowerObserver):
         Considers available resources and spade exchanges.
         """
         # Check direct resources
-        if cost.get("workers", 0) > self.__resources["workers"]:
+        if cost.get("workers", 0) > self.__workers:
             return False
-        if cost.get("coins", 0) > self.__resources["coins"]:
+        if cost.get("coins", 0) > self.__coins:
             return False
         if cost.get("power", 0) > self.available_power:
             return False
@@ -147,9 +193,7 @@ class Player(PowerObserver):
             spades_short = spades_needed - self.__spades_available
             if spades_short > 0:
                 workers_needed = spades_short * SPADE_EXCHANGE_RATE
-                if workers_needed > self.__resources["workers"] - cost.get(
-                    "workers", 0
-                ):
+                if workers_needed > self.__workers - cost.get("workers", 0):
                     return False
 
         return True
@@ -161,8 +205,8 @@ class Player(PowerObserver):
             raise ValueError(f"Cannot afford cost: {cost}")
 
         # Spend basic resources
-        self.__resources["workers"] -= cost.get("workers", 0)
-        self.__resources["coins"] -= cost.get("coins", 0)
+        self.__workers -= cost.get("workers", 0)
+        self.__coins -= cost.get("coins", 0)
 
         if power_cost := cost.get("power", 0):
             self.__power_manager.spend_power(power_cost)
@@ -175,22 +219,34 @@ class Player(PowerObserver):
                 # Need to exchange workers for spades
                 spades_short = spades_needed - self.__spades_available
                 workers_needed = spades_short * SPADE_EXCHANGE_RATE
-                self.__resources["workers"] -= workers_needed
+                self.__workers -= workers_needed
                 self.__spades_available = 0
 
     def gain_resource(self, resource: str, amount: int) -> None:
         if amount < 0:
             raise ValueError("Cannot gain negative resources")
 
-        match resource:
-            case "workers":
-                self.__resources["workers"] += amount
-            case "coins":
-                self.__resources["coins"] += amount
-            case "power":
-                self.__power_manager.gain_power(amount)
-            case _:
-                raise ValueError(f"Unknown resource: {resource}")
+        handler = Player.__GAIN_HANDLERS.get(resource)
+        if handler is None:
+            raise ValueError(f"Unknown resource: {resource}")
+
+        handler(self, amount)
+
+    def _gain_workers(self, amount: int) -> None:
+        self.__workers += amount
+
+    def _gain_coins(self, amount: int) -> None:
+        self.__coins += amount
+
+    def _gain_power(self, amount: int) -> None:
+        self.__power_manager.gain_power(amount)
+
+    # Dispatch table for gain_resource, one entry per resource name
+    __GAIN_HANDLERS: ClassVar[dict[str, Callable[[Player, int], None]]] = {
+        "workers": _gain_workers,
+        "coins": _gain_coins,
+        "power": _gain_power,
+    }
 
     def gain_spades(self, amount: int) -> None:
         if amount < 0:
@@ -208,9 +264,18 @@ class Player(PowerObserver):
 
     # Building management
 
-    def add_building(self, position: HexCoord) -> None:
+    def add_building(
+        self, position: HexCoord, building_type: BuildingType = BuildingType.DWELLING
+    ) -> None:
         self.__buildings_on_board.append(position)
 
+        # Push this building's power to its neighboring hexes now, so each
+        # notification reads its adjacent power with a single lookup
+        power = BUILDING_POWER_VALUES[building_type]
+        adjacent_power = self.__adjacent_power
+        for neighbor_pos in self.__board.get_valid_neighbors(position):
+            adjacent_power[neighbor_pos] = adjacent_power.get(neighbor_pos, 0) + power
+
     # Turn management
 
     def start_turn(self) -> None:
@@ -272,14 +337,7 @@ class Player(PowerObserver):
 
     def _calculate_adjacent_power(self, new_building_pos: HexCoord) -> int:
         """Calculate power gain from owned buildings adjacent to new building."""
-        total_power = 0
-
-        for neighbor_pos in self.__board.get_valid_neighbors(new_building_pos):
-            building = self.__board.get_building(neighbor_pos)
-            if building and building["owner"] == self.__name:
-                total_power += BUILDING_POWER_VALUES[building["type"]]
-
-        return total_power
+        return self.__adjacent_power.get(new_building_pos, 0)
 
     # Data export
 
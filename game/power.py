@@ -5,6 +5,8 @@ from .game_types import PowerCount
 class PowerManager:
     """Simplified power system - single score instead of bowls."""
 
+    __slots__ = ("__power", "__max_power")
+
     __power: PowerCount
     __max_power: PowerCount
 
@@ -22,6 +22,12 @@ def test_hexcoord_flyweight() -> None:
     assert coord1 is coord2
     # Different coordinates should be different instances
     assert coord1 is not coord3
+
+    # Coordinates beyond 32 bits stay distinct from small ones
+    far = HexCoord(2**32 - 1, 5)
+    assert far.q == 2**32 - 1
+    assert far != HexCoord(-1, 5)
+    assert HexCoord(2**32, 0) != HexCoord(0, 0)
     
     print("✓ Flyweight pattern working correctly")
 
@@ -244,6 +250,24 @@ def test_range_queries_for_cult_bonuses() -> None:
     print("✓ Range queries for area effects working")
 
 
+def test_grid_bounds() -> None:
+    """Test that bounds track every inserted position, away from the origin too."""
+    grid: HexGrid[str] = HexGrid()
+
+    grid.set(HexCoord(2, 3), "forest")
+    assert grid.get_bounds() == (HexCoord(2, 3), HexCoord(2, 3))
+
+    grid.set(HexCoord(5, 1), "plains")
+    grid.set(HexCoord(-1, 4), "desert")
+    assert grid.get_bounds() == (HexCoord(-1, 1), HexCoord(5, 4))
+
+    # Overwriting a position leaves the bounds unchanged
+    grid.set(HexCoord(5, 1), "swamp")
+    assert grid.get_bounds() == (HexCoord(-1, 1), HexCoord(5, 4))
+
+    print("✓ Grid bounds tracked correctly")
+
+
 def run_all_tests() -> None:
     """Run all tests."""
     print("Running HexCoord and HexGrid tests for Terra Mystica...\n")
@@ -260,6 +284,7 @@ def run_all_tests() -> None:
     test_power_bowl_adjacency()
     test_pathfinding_for_connected_areas()
     test_range_queries_for_cult_bonuses()
+    test_grid_bounds()
     
     print("\n✅ All tests passed!")
 